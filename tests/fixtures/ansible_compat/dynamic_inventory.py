@@ -5,126 +5,146 @@ Dynamic Inventory Script Compatibility Test
 This script demonstrates dynamic inventory format that Rustible should support.
 When called with --list, it outputs JSON inventory data.
 When called with --host <hostname>, it outputs host-specific variables.
+Output is compact JSON; add --pretty for indented output.
 
 Tests: JSON output format, _meta/hostvars, groups, children
 """
 
 import json
 import sys
-import argparse
 
+_USAGE = "usage: dynamic_inventory.py [--list | --host HOSTNAME] [--pretty]\n"
 
-def get_inventory():
-    """Return the complete inventory as a dictionary."""
-    return {
-        "webservers": {
-            "hosts": ["web1", "web2", "web3"],
-            "vars": {
-                "nginx_version": "1.18",
-                "server_type": "nginx",
-                "max_connections": 1000
-            }
-        },
-        "databases": {
-            "hosts": ["db1", "db2"],
-            "vars": {
-                "db_engine": "postgresql",
-                "db_version": "14"
-            }
-        },
-        "appservers": {
-            "hosts": ["app1", "app2", "app3"],
-            "vars": {
-                "app_user": "apprunner",
-                "app_environment": "production"
-            }
-        },
-        "production": {
-            "children": ["webservers", "databases", "appservers"],
-            "vars": {
-                "environment": "production",
-                "log_level": "warn"
-            }
-        },
-        "staging": {
-            "hosts": ["staging1"],
-            "vars": {
-                "environment": "staging",
-                "log_level": "debug"
-            }
-        },
-        "_meta": {
-            "hostvars": {
-                "web1": {
-                    "ansible_host": "192.168.1.10",
-                    "ansible_user": "deploy",
-                    "http_port": 80
-                },
-                "web2": {
-                    "ansible_host": "192.168.1.11",
-                    "ansible_user": "deploy",
-                    "http_port": 8080
-                },
-                "web3": {
-                    "ansible_host": "192.168.1.12",
-                    "ansible_user": "webadmin",
-                    "ansible_ssh_private_key_file": "~/.ssh/web_key"
-                },
-                "db1": {
-                    "ansible_host": "192.168.1.20",
-                    "ansible_user": "dbadmin",
-                    "db_port": 5432,
-                    "db_role": "primary"
-                },
-                "db2": {
-                    "ansible_host": "192.168.1.21",
-                    "ansible_user": "dbadmin",
-                    "db_port": 5432,
-                    "db_role": "replica"
-                },
-                "app1": {
-                    "ansible_host": "192.168.1.30",
-                    "app_port": 5000
-                },
-                "app2": {
-                    "ansible_host": "192.168.1.31",
-                    "app_port": 5001
-                },
-                "app3": {
-                    "ansible_host": "192.168.1.32",
-                    "app_port": 5002
-                },
-                "staging1": {
-                    "ansible_host": "192.168.2.10",
-                    "environment": "staging"
-                }
+
+def _dumps(obj, pretty=False):
+    """Serialize obj to JSON bytes, newline-terminated like print().
+
+    Output is compact unless pretty is set: Ansible only parses it.
+    """
+    if pretty:
+        text = json.dumps(obj, indent=2)
+    else:
+        text = json.dumps(obj, separators=(",", ":"))
+    return (text + "\n").encode("utf-8")
+
+
+# Static inventory, built once at import rather than on every lookup.
+_INVENTORY = {
+    "webservers": {
+        "hosts": ["web1", "web2", "web3"],
+        "vars": {
+            "nginx_version": "1.18",
+            "server_type": "nginx",
+            "max_connections": 1000
+        }
+    },
+    "databases": {
+        "hosts": ["db1", "db2"],
+        "vars": {
+            "db_engine": "postgresql",
+            "db_version": "14"
+        }
+    },
+    "appservers": {
+        "hosts": ["app1", "app2", "app3"],
+        "vars": {
+            "app_user": "apprunner",
+            "app_environment": "production"
+        }
+    },
+    "production": {
+        "children": ["webservers", "databases", "appservers"],
+        "vars": {
+            "environment": "production",
+            "log_level": "warn"
+        }
+    },
+    "staging": {
+        "hosts": ["staging1"],
+        "vars": {
+            "environment": "staging",
+            "log_level": "debug"
+        }
+    },
+    "_meta": {
+        "hostvars": {
+            "web1": {
+                "ansible_host": "192.168.1.10",
+                "ansible_user": "deploy",
+                "http_port": 80
+            },
+            "web2": {
+                "ansible_host": "192.168.1.11",
+                "ansible_user": "deploy",
+                "http_port": 8080
+            },
+            "web3": {
+                "ansible_host": "192.168.1.12",
+                "ansible_user": "webadmin",
+                "ansible_ssh_private_key_file": "~/.ssh/web_key"
+            },
+            "db1": {
+                "ansible_host": "192.168.1.20",
+                "ansible_user": "dbadmin",
+                "db_port": 5432,
+                "db_role": "primary"
+            },
+            "db2": {
+                "ansible_host": "192.168.1.21",
+                "ansible_user": "dbadmin",
+                "db_port": 5432,
+                "db_role": "replica"
+            },
+            "app1": {
+                "ansible_host": "192.168.1.30",
+                "app_port": 5000
+            },
+            "app2": {
+                "ansible_host": "192.168.1.31",
+                "app_port": 5001
+            },
+            "app3": {
+                "ansible_host": "192.168.1.32",
+                "app_port": 5002
+            },
+            "staging1": {
+                "ansible_host": "192.168.2.10",
+                "environment": "staging"
             }
         }
     }
+}
+
+
+def get_inventory():
+    """Return the complete inventory as a dictionary."""
+    return _INVENTORY
 
 
 def get_host_vars(hostname):
     """Return variables for a specific host."""
-    inventory = get_inventory()
-    hostvars = inventory.get("_meta", {}).get("hostvars", {})
-    return hostvars.get(hostname, {})
+    return _INVENTORY["_meta"]["hostvars"].get(hostname, {})
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Dynamic inventory script')
-    parser.add_argument('--list', action='store_true',
-                        help='List all groups and hosts')
-    parser.add_argument('--host', type=str,
-                        help='Get variables for a specific host')
-    args = parser.parse_args()
-
-    if args.list:
-        print(json.dumps(get_inventory(), indent=2))
-    elif args.host:
-        print(json.dumps(get_host_vars(args.host), indent=2))
+    # Ansible only ever passes --list or --host <hostname>, so a plain argv
+    # check is enough and keeps argparse off the startup path.
+    argv = sys.argv[1:]
+    pretty = '--pretty' in argv
+    if pretty:
+        argv.remove('--pretty')
+    if len(argv) == 1 and argv[0].startswith('--host='):
+        argv = ['--host', argv[0][len('--host='):]]
+
+    if not argv or argv == ['--list']:
+        # --list, which is also the default
+        out = _dumps(get_inventory(), pretty=pretty)
+    elif len(argv) == 2 and argv[0] == '--host':
+        out = _dumps(get_host_vars(argv[1]), pretty=pretty)
     else:
-        # Default to --list
-        print(json.dumps(get_inventory(), indent=2))
+        sys.stderr.write(_USAGE)
+        sys.exit(2)
+    sys.stdout.buffer.write(out)
 
 
 if __name__ == '__main__':
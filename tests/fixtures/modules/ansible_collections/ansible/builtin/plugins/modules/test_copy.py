@@ -7,12 +7,22 @@ import json
 import os
 import base64
 
+def _decode_args():
+    """Decode ANSIBLE_MODULE_ARGS, given as base64 or plain JSON."""
+    raw = os.environ.get('ANSIBLE_MODULE_ARGS') or '{}'
+    # base64 never starts with '{' or '[', so plain JSON (which may have
+    # leading whitespace) needs no decode probe
+    data = raw if raw.lstrip()[:1] in '{[' else base64.b64decode(raw)
+    return json.loads(data)
+
+def _emit(result):
+    """Write the module result as one JSON line straight to fd 1."""
+    data = json.dumps(result).encode('utf-8') + b'\n'
+    while data:
+        data = data[os.write(1, data):]
+
 def main():
-    args_b64 = os.environ.get('ANSIBLE_MODULE_ARGS', '{}')
-    try:
-        args = json.loads(base64.b64decode(args_b64).decode('utf-8'))
-    except:
-        args = json.loads(args_b64) if args_b64 != '{}' else {}
+    args = _decode_args()
 
     src = args.get('src', '')
     dest = args.get('dest', '')
@@ -26,7 +36,7 @@ def main():
         'fqcn': 'ansible.builtin.test_copy',
     }
 
-    print(json.dumps(result))
+    _emit(result)
 
 if __name__ == '__main__':
     main()
@@ -7,12 +7,32 @@ import json
 import os
 import base64
 
+_TYPE_NAMES = {
+    str: 'str',
+    int: 'int',
+    bool: 'bool',
+    float: 'float',
+    list: 'list',
+    dict: 'dict',
+    type(None): 'NoneType',
+}
+
+def _decode_args():
+    """Decode ANSIBLE_MODULE_ARGS, given as base64 or plain JSON."""
+    raw = os.environ.get('ANSIBLE_MODULE_ARGS') or '{}'
+    # base64 never starts with '{' or '[', so plain JSON (which may have
+    # leading whitespace) needs no decode probe
+    data = raw if raw.lstrip()[:1] in '{[' else base64.b64decode(raw)
+    return json.loads(data)
+
+def _emit(result):
+    """Write the module result as one JSON line straight to fd 1."""
+    data = json.dumps(result).encode('utf-8') + b'\n'
+    while data:
+        data = data[os.write(1, data):]
+
 def main():
-    args_b64 = os.environ.get('ANSIBLE_MODULE_ARGS', '{}')
-    try:
-        args = json.loads(base64.b64decode(args_b64).decode('utf-8'))
-    except:
-        args = json.loads(args_b64) if args_b64 != '{}' else {}
+    args = _decode_args()
 
     # Extract various argument types
     string_arg = args.get('string_arg', '')
@@ -27,20 +47,20 @@ def main():
         'msg': 'Complex arguments processed successfully',
         'received': {
             'string_arg': string_arg,
-            'string_arg_type': type(string_arg).__name__,
+            'string_arg_type': _TYPE_NAMES.get(type(string_arg)) or type(string_arg).__name__,
             'int_arg': int_arg,
-            'int_arg_type': type(int_arg).__name__,
+            'int_arg_type': _TYPE_NAMES.get(type(int_arg)) or type(int_arg).__name__,
             'bool_arg': bool_arg,
-            'bool_arg_type': type(bool_arg).__name__,
+            'bool_arg_type': _TYPE_NAMES.get(type(bool_arg)) or type(bool_arg).__name__,
             'list_arg': list_arg,
-            'list_arg_type': type(list_arg).__name__,
+            'list_arg_type': _TYPE_NAMES.get(type(list_arg)) or type(list_arg).__name__,
             'dict_arg': dict_arg,
-            'dict_arg_type': type(dict_arg).__name__,
+            'dict_arg_type': _TYPE_NAMES.get(type(dict_arg)) or type(dict_arg).__name__,
             'nested_arg': nested_arg,
         }
     }
 
-    print(json.dumps(result))
+    _emit(result)
 
 if __name__ == '__main__':
     main()
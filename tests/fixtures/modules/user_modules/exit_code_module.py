@@ -8,12 +8,22 @@ import os
 import sys
 import base64
 
+def _decode_args():
+    """Decode ANSIBLE_MODULE_ARGS, given as base64 or plain JSON."""
+    raw = os.environ.get('ANSIBLE_MODULE_ARGS') or '{}'
+    # base64 never starts with '{' or '[', so plain JSON (which may have
+    # leading whitespace) needs no decode probe
+    data = raw if raw.lstrip()[:1] in '{[' else base64.b64decode(raw)
+    return json.loads(data)
+
+def _emit(result):
+    """Write the module result as one JSON line straight to fd 1."""
+    data = json.dumps(result).encode('utf-8') + b'\n'
+    while data:
+        data = data[os.write(1, data):]
+
 def main():
-    args_b64 = os.environ.get('ANSIBLE_MODULE_ARGS', '{}')
-    try:
-        args = json.loads(base64.b64decode(args_b64).decode('utf-8'))
-    except:
-        args = json.loads(args_b64) if args_b64 != '{}' else {}
+    args = _decode_args()
 
     exit_code = args.get('exit_code', 0)
 
@@ -23,7 +33,14 @@ def main():
         'exit_code': exit_code,
     }
 
-    print(json.dumps(result))
+    # _emit() writes straight to fd 1, so there is nothing left to flush and
+    # interpreter shutdown can be skipped for plain exit statuses.
+    _emit(result)
+    if exit_code is None:
+        os._exit(0)
+    if isinstance(exit_code, int) and 0 <= exit_code <= 255:
+        os._exit(exit_code)
+    # Leave anything else to sys.exit(), which maps it to a status itself
     sys.exit(exit_code)
 
 if __name__ == '__main__':